@@ -8,6 +8,8 @@ import requests
 import json
 from dotenv import load_dotenv
 
+from porkbun_records import PorkbunAPIError, iter_domain_records
+
 # Load environment variables
 env_path = os.path.join(os.path.dirname(__file__), '.env')
 load_dotenv(env_path)
@@ -52,29 +54,23 @@ def main():
         return
     
     # Get all domains
-    url = f"{PORKBUN_API_URL}/domain/listAll"
-    payload = {
-        'apikey': PORKBUN_API_KEY,
-        'secretapikey': PORKBUN_SECRET_KEY
-    }
-    
     try:
-        response = requests.post(url, json=payload)
-        response.raise_for_status()
-        data = response.json()
-        
-        if data.get('status') != 'SUCCESS':
-            print("❌ Failed to retrieve domains")
-            return
-            
-        domains = data.get('domains', [])
-        print(f"Found {len(domains)} domains in your account\n")
-        
+        domains = list(iter_domain_records(
+            {'apikey': PORKBUN_API_KEY, 'secretapikey': PORKBUN_SECRET_KEY},
+            api_url=PORKBUN_API_URL
+        ))
+    except PorkbunAPIError as e:
+        print(f"❌ Failed to retrieve domains: {e}")
+        return
+
+    print(f"Found {len(domains)} domains in your account\n")
+
+    try:
         enabled_domains = []
         disabled_domains = []
         
         for domain_info in domains:
-            domain = domain_info.get('domain')
+            domain = domain_info.domain
             print(f"Checking {domain}... ", end="", flush=True)
             
             access_info = check_api_access_for_domain(domain)
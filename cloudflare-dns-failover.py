@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Health-check-driven DNS failover for Cloudflare records.
+
+Every record in the config has a pool of candidate origin IPs. All origins are
+probed concurrently (TCP connect or HTTP(S) GET, with timeouts) every
+`interval` seconds and each keeps a rolling health score. An origin only
+flips between healthy and unhealthy when its score crosses the rise/fall
+thresholds, so a single lost probe does not cause flapping. Origins start out
+healthy, so a restart needs the same two failed probes to take one out. The
+record set is only rewritten through the Cloudflare API when the healthy set
+differs from what Cloudflare already holds.
+
+Example config (failover.json):
+
+    {
+      "interval": 5,
+      "timeout": 2,
+      "records": [
+        {"name": "www", "type": "A", "proxied": true,
+         "origins": ["203.0.113.10", "203.0.113.11"],
+         "check": {"kind": "http", "port": 80, "path": "/health"}}
+      ]
+    }
+
+Origins may carry their own probe port ("127.0.0.2:8001"), which makes it
+easy to try the failover locally against dummy origins, e.g.
+`python -m http.server 8001 --bind 127.0.0.2`, together with --dry-run.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import ssl
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+import requests
+from dotenv import load_dotenv
+
+from cloudflare_dns import list_records, make_session, normalize, sync_record_set
+
+# Load environment variables from .env file
+env_path = os.path.join(os.path.dirname(__file__), '.env')
+load_dotenv(env_path)
+
+CLOUDFLARE_API_TOKEN = os.getenv('CLOUDFLARE_API_TOKEN')
+CLOUDFLARE_ZONE_ID = os.getenv('CLOUDFLARE_ZONE_ID')
+DOMAIN = os.getenv('CLOUDFLARE_DOMAIN')  # e.g., example.com
+
+DEFAULT_INTERVAL = 5
+DEFAULT_TIMEOUT = 2
+# Rolling score: score = ALPHA * result + (1 - ALPHA) * score.
+# A fully healthy origin goes down after 2 failed probes in a row. A down
+# origin always scores below FALL_THRESHOLD, so it needs 3 successful probes
+# in a row to come back (0.3 -> 0.65 -> 0.825 -> 0.9125).
+ALPHA = 0.5
+RISE_THRESHOLD = 0.85
+FALL_THRESHOLD = 0.3
+MAX_PROBE_WORKERS = 256
+
+# (kind, host, port, path, host_header)
+Target = Tuple[str, str, int, str, Optional[str]]
+
+
+class OriginHealth:
+    """Rolling health score with hysteresis for one probe target."""
+    __slots__ = ('score', 'healthy')
+
+    def __init__(self):
+        # Assume healthy so a single failed first probe cannot pull an origin
+        self.score = 1.0
+        self.healthy = True
+
+    def record(self, ok: bool) -> bool:
+        """Adds a probe result; returns True if the healthy state flipped."""
+        self.score = ALPHA * ok + (1 - ALPHA) * self.score
+        if self.healthy and self.score < FALL_THRESHOLD:
+            self.healthy = False
+            return True
+        if not self.healthy and self.score > RISE_THRESHOLD:
+            self.healthy = True
+            return True
+        return False
+
+
+def split_origin(origin: str) -> Tuple[str, Optional[int]]:
+    """Splits '1.2.3.4:8080' or '[2001:db8::1]:8080' into (ip, port)."""
+    if origin.startswith('['):
+        host, _, rest = origin[1:].partition(']')
+        return host, int(rest[1:]) if rest.startswith(':') else None
+    if origin.count(':') == 1:
+        host, port = origin.split(':')
+        return host, int(port)
+    return origin, None
+
+
+def probe_target(target: Target, timeout: float) -> bool:
+    """Runs one TCP or HTTP(S) health check."""
+    kind, host, port, path, host_header = target
+    try:
+        if kind == 'tcp':
+            with socket.create_connection((host, port), timeout=timeout):
+                return True
+        if kind == 'https':
+            context = ssl.create_default_context()
+            # Origins are probed by IP, so the certificate cannot match the name
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+            conn = http.client.HTTPSConnection(host, port, timeout=timeout, context=context)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        try:
+            conn.request('GET', path, headers={'Host': host_header or host, 'User-Agent': 'dns-failover'})
+            return conn.getresponse().status < 400
+        finally:
+            conn.close()
+    except (OSError, http.client.HTTPException):
+        return False
+
+
+def load_config(path: str) -> Dict:
+    """Loads the failover config and resolves every record's probe targets."""
+    with open(path) as f:
+        config = json.load(f)
+
+    for record in config.get('records', []):
+        check = record.setdefault('check', {})
+        kind = check.get('kind', 'tcp')
+        default_port = check.get('port', {'tcp': 80, 'http': 80, 'https': 443}[kind])
+        record.setdefault('type', 'A')
+        record['targets'] = {}
+        for origin in record['origins']:
+            ip, port = split_origin(origin)
+            ip = normalize(record['type'], ip)
+            target = (kind, ip, port or default_port, check.get('path', '/'), check.get('host'))
+            record['targets'][target] = ip
+    return config
+
+
+def record_fqdn(record: Dict) -> str:
+    # Use '@' for the root domain
+    if record['name'] == '@':
+        return DOMAIN or '@'
+    return f"{record['name']}.{DOMAIN}" if DOMAIN else record['name']
+
+
+def healthy_ips(record: Dict, health: Dict[Target, OriginHealth]) -> Set[str]:
+    """Returns the IPs of the record's origins that are currently healthy."""
+    return {ip for target, ip in record['targets'].items() if health[target].healthy}
+
+
+def run(config: Dict, dry_run: bool = False, once: bool = False):
+    """Probes origins forever (or once) and repoints records on health changes."""
+    interval = config.get('interval', DEFAULT_INTERVAL)
+    timeout = config.get('timeout', DEFAULT_TIMEOUT)
+    records: List[Dict] = config['records']
+    targets = list(dict.fromkeys(target for record in records for target in record['targets']))
+    health: Dict[Target, OriginHealth] = {target: OriginHealth() for target in targets}
+    # Last set known to be in Cloudflare for each (name, type); None forces a sync
+    applied: Dict[Tuple[str, str], Optional[Set[str]]] = {(r['name'], r['type']): None for r in records}
+    session = None if dry_run else make_session(CLOUDFLARE_API_TOKEN)
+
+    if session:
+        # Start from the live record sets so a restart does not rewrite them
+        for record in records:
+            key = (record['name'], record['type'])
+            try:
+                existing = list_records(session, CLOUDFLARE_ZONE_ID, record_fqdn(record), record['type'])
+            except requests.exceptions.RequestException as e:
+                print(f"⚠️  Could not read the current '{record['name']}' records, will sync them: {e}")
+                continue
+            applied[key] = {normalize(record['type'], r['content']) for r in existing}
+
+    print(f"Monitoring {len(targets)} origin(s) across {len(records)} record(s) every {interval}s")
+
+    def apply(record: Dict, ips: Set[str]) -> Tuple[Dict, Set[str], Dict]:
+        fqdn = record_fqdn(record)
+        if dry_run:
+            return record, ips, {'record': fqdn, 'dry_run': True, 'values': sorted(ips)}
+        try:
+            result = sync_record_set(session, CLOUDFLARE_ZONE_ID, fqdn, record['type'], sorted(ips),
+                                     proxied=record.get('proxied', False))
+        except requests.exceptions.RequestException as e:
+            result = {'record': fqdn, 'errors': [{'error': str(e)}]}
+        return record, ips, result
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PROBE_WORKERS, max(len(targets), 1))) as pool:
+        while True:
+            started = time.monotonic()
+            results = pool.map(lambda target: probe_target(target, timeout), targets)
+            for target, ok in zip(targets, results):
+                if health[target].record(ok):
+                    state = 'UP' if health[target].healthy else 'DOWN'
+                    print(f"[{time.strftime('%H:%M:%S')}] {target[1]}:{target[2]} is {state}")
+
+            changed = []
+            for record in records:
+                key = (record['name'], record['type'])
+                ips = healthy_ips(record, health)
+                if not ips:
+                    # Never empty a record: keep pointing at the last known set
+                    if applied[key] != set():
+                        print(f"⚠️  All origins of '{record['name']}' are down; leaving the record alone")
+                        applied[key] = set()
+                    continue
+                if ips != applied[key]:
+                    changed.append((record, ips))
+
+            for record, ips, result in pool.map(lambda change: apply(*change), changed):
+                if result.get('errors'):
+                    # Leave `applied` alone so the next cycle retries
+                    print(f"❌ Failed to update '{record['name']}': {json.dumps(result['errors'])}")
+                    continue
+                applied[(record['name'], record['type'])] = ips
+                print(f"✅ '{record['name']}' -> {', '.join(sorted(ips))}")
+                if dry_run or result.get('created') or result.get('updated') or result.get('deleted'):
+                    print(f"   {json.dumps(result)}")
+
+            if once:
+                return
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Health-check-driven Cloudflare DNS failover.")
+    parser.add_argument('config', nargs='?', default='failover.json', help="Failover config file (JSON)")
+    parser.add_argument('--dry-run', action='store_true', help="Probe and report, but never call the Cloudflare API")
+    parser.add_argument('--once', action='store_true', help="Run a single probe cycle and exit")
+    args = parser.parse_args()
+
+    print("Cloudflare DNS Failover")
+    print("-----------------------")
+
+    if not args.dry_run and not all([CLOUDFLARE_API_TOKEN, CLOUDFLARE_ZONE_ID, DOMAIN]):
+        print("\nError: Missing required environment variables.")
+        print("Please ensure CLOUDFLARE_API_TOKEN, CLOUDFLARE_ZONE_ID, and CLOUDFLARE_DOMAIN are set in your .env file.")
+        return
+
+    try:
+        config = load_config(args.config)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"\nError: Could not load {args.config}: {e}")
+        return
+
+    try:
+        run(config, dry_run=args.dry_run, once=args.once)
+    except KeyboardInterrupt:
+        print("\nStopped.")
+
+
+if __name__ == '__main__':
+    main()
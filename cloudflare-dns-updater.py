@@ -7,66 +7,46 @@ import requests
 from dotenv import load_dotenv
 import json
 
+from cloudflare_dns import make_session, sync_record_set
+
 # Load environment variables from .env file
 env_path = os.path.join(os.path.dirname(__file__), '.env')
 load_dotenv(env_path)
 
-CLOUDFLARE_API = 'https://api.cloudflare.com/client/v4'
 CLOUDFLARE_API_TOKEN = os.getenv('CLOUDFLARE_API_TOKEN')
 CLOUDFLARE_ZONE_ID = os.getenv('CLOUDFLARE_ZONE_ID')
 DOMAIN = os.getenv('CLOUDFLARE_DOMAIN')  # e.g., example.com
 
-def update_dns_logic(record_name, record_type, ip_address, proxied):
-    if not all([record_name, ip_address, CLOUDFLARE_API_TOKEN, CLOUDFLARE_ZONE_ID, DOMAIN]):
+def update_dns_logic(record_name, record_type, content, proxied):
+    """Sets the record set for record_name/record_type to the given value(s).
+
+    `content` is a single value or a list of values. Records that already
+    match are left alone; only the missing values are created and the stale
+    records updated or deleted.
+    """
+    values = [content] if isinstance(content, str) else list(content or [])
+    values = [value for value in values if value and value.strip()]
+    if not all([record_name, values, CLOUDFLARE_API_TOKEN, CLOUDFLARE_ZONE_ID, DOMAIN]):
         return {'success': False, 'error': 'Missing required parameters or environment variables'}, 400
 
-    headers = {
-        'Authorization': f'Bearer {CLOUDFLARE_API_TOKEN}',
-        'Content-Type': 'application/json'
-    }
-    
+    session = make_session(CLOUDFLARE_API_TOKEN)
+
     # Use '@' for the root domain
     fqdn = DOMAIN if record_name == '@' else f"{record_name}.{DOMAIN}"
 
-    # Get DNS record ID
-    get_url = f"{CLOUDFLARE_API}/zones/{CLOUDFLARE_ZONE_ID}/dns_records"
-    params = {'name': fqdn, 'type': record_type}
-    get_resp = requests.get(get_url, headers=headers, params=params)
-    if not get_resp.ok:
-        return {'success': False, 'error': 'Failed to query DNS records', 'details': get_resp.text}, 500
-    records = get_resp.json().get('result', [])
-
-    if records:
-        # Update existing record
-        record_id = records[0]['id']
-        update_url = f"{CLOUDFLARE_API}/zones/{CLOUDFLARE_ZONE_ID}/dns_records/{record_id}"
-        payload = {
-            'type': record_type,
-            'name': fqdn,
-            'content': ip_address,
-            'ttl': 1,
-            'proxied': proxied
-        }
-        upd_resp = requests.put(update_url, headers=headers, json=payload)
-        if upd_resp.ok:
-            return {'success': True, 'action': 'updated', 'record': fqdn, 'response': upd_resp.json()}, 200
-        else:
-            return {'success': False, 'error': 'Failed to update record', 'details': upd_resp.text}, 500
-    else:
-        # Create new record
-        create_url = f"{CLOUDFLARE_API}/zones/{CLOUDFLARE_ZONE_ID}/dns_records"
-        payload = {
-            'type': record_type,
-            'name': fqdn,
-            'content': ip_address,
-            'ttl': 1,
-            'proxied': proxied
-        }
-        crt_resp = requests.post(create_url, headers=headers, json=payload)
-        if crt_resp.ok:
-            return {'success': True, 'action': 'created', 'record': fqdn, 'response': crt_resp.json()}, 201
-        else:
-            return {'success': False, 'error': 'Failed to create record', 'details': crt_resp.text}, 500
+    try:
+        result = sync_record_set(session, CLOUDFLARE_ZONE_ID, fqdn, record_type, values, proxied)
+    except requests.exceptions.RequestException as e:
+        details = e.response.text if e.response is not None else 'No response'
+        return {'success': False, 'error': 'Failed to query DNS records', 'details': details}, 500
+
+    if result['errors']:
+        return {'success': False, 'error': 'Failed to apply some record changes', **result}, 500
+
+    changed = result['created'] or result['updated'] or result['deleted']
+    action = 'synced' if changed else 'unchanged'
+    status_code = 201 if result['created'] and not (result['updated'] or result['deleted']) else 200
+    return {'success': True, 'action': action, **result}, status_code
 
 def main():
     """Main function to run the interactive DNS updater."""
@@ -90,14 +70,26 @@ def main():
         choices=['A', 'AAAA', 'CNAME', 'TXT', 'MX']
     ).ask()
 
-    content = questionary.text(f"Enter the content for the {record_type} record:").ask()
+    # A name/type pair is a record set: collect every value it should hold
+    print("Enter every value the record set should contain. Existing records not listed are removed.")
+    if record_type == 'MX':
+        print("MX values take the priority first, e.g. '10 mail.example.com'.")
+    content = []
+    while True:
+        value = questionary.text(
+            f"Enter value {len(content) + 1} for the {record_type} record"
+            + (" (leave empty to finish):" if content else ":")
+        ).ask()
+        if not value:
+            break
+        content.append(value)
     if not content:
         print("Operation cancelled: Content cannot be empty.")
         return
 
     proxied = questionary.confirm("Should the record be proxied by Cloudflare?", default=True).ask()
 
-    print("\nUpdating DNS record...")
+    print("\nUpdating DNS record set...")
     result, status_code = update_dns_logic(record_name, record_type, content, proxied)
 
     print(f"\nResult (Status: {status_code}):")
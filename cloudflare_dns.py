@@ -0,0 +1,180 @@
+"""
+Cloudflare DNS record-set helpers.
+
+A record set is every record sharing a name and type (round-robin A/AAAA,
+several MX or TXT records). sync_record_set() makes Cloudflare hold exactly
+the desired values: records that already match are left alone, stale ones are
+rewritten in place or deleted, and missing ones are created. The API calls run
+concurrently.
+"""
+
+import ipaddress
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+CLOUDFLARE_API = 'https://api.cloudflare.com/client/v4'
+PROXIABLE_TYPES = {'A', 'AAAA', 'CNAME'}
+MAX_WORKERS = 8
+
+
+def make_session(api_token: str) -> requests.Session:
+    """Returns a session carrying the Cloudflare auth headers."""
+    session = requests.Session()
+    session.headers.update({
+        'Authorization': f'Bearer {api_token}',
+        'Content-Type': 'application/json'
+    })
+    return session
+
+
+def parse_value(record_type: str, value: str) -> Tuple[str, Optional[int]]:
+    """Splits a user value into (content, priority); MX values look like '10 mail.example.com'."""
+    value = value.strip()
+    if record_type == 'MX':
+        priority, _, content = value.partition(' ')
+        if priority.isdigit() and content:
+            return content.strip(), int(priority)
+        return value, 10
+    return value, None
+
+
+def normalize(record_type: str, content: str) -> str:
+    """Canonical form of a record's content so equal values compare equal."""
+    content = content.strip()
+    if record_type in ('A', 'AAAA'):
+        try:
+            return str(ipaddress.ip_address(content))
+        except ValueError:
+            return content
+    if record_type == 'TXT':
+        # Cloudflare may hand TXT content back wrapped in quotes
+        if len(content) >= 2 and content[0] == content[-1] == '"':
+            return content[1:-1]
+        return content
+    return content.rstrip('.').lower()
+
+
+def record_key(record_type: str, content: str, priority: Optional[int]) -> Tuple[str, Optional[int]]:
+    """Identity of a record within its set; MX priority is part of it."""
+    return normalize(record_type, content), priority if record_type == 'MX' else None
+
+
+def list_records(session: requests.Session, zone_id: str, fqdn: str, record_type: str) -> List[Dict]:
+    """Returns every record with this name and type, following pagination."""
+    url = f"{CLOUDFLARE_API}/zones/{zone_id}/dns_records"
+    records = []
+    page = 1
+    while True:
+        params = {'name': fqdn, 'type': record_type, 'page': page, 'per_page': 100}
+        resp = session.get(url, params=params)
+        resp.raise_for_status()
+        data = resp.json()
+        records.extend(data.get('result', []))
+        info = data.get('result_info') or {}
+        if page >= info.get('total_pages', 1):
+            return records
+        page += 1
+
+
+def _record_payload(fqdn: str, record_type: str, content: str, priority: Optional[int],
+                    proxied: bool, ttl: int) -> Dict:
+    payload = {'type': record_type, 'name': fqdn, 'content': content, 'ttl': ttl}
+    if record_type in PROXIABLE_TYPES:
+        payload['proxied'] = proxied
+    if priority is not None:
+        payload['priority'] = priority
+    return payload
+
+
+def plan_record_set(existing: List[Dict], record_type: str, values: Iterable[str], proxied: bool):
+    """Diffs the desired values against existing records.
+
+    Returns (unchanged, to_update, to_create, to_delete). Stale records are
+    paired with missing values and rewritten in place, so replacing a single
+    value never leaves the name without a record.
+    """
+    desired = {}
+    for value in values:
+        content, priority = parse_value(record_type, value)
+        desired.setdefault(record_key(record_type, content, priority), (content, priority))
+
+    unchanged, to_update, stale = [], [], []
+    for record in existing:
+        key = record_key(record_type, record.get('content', ''), record.get('priority'))
+        if key in desired:
+            content, priority = desired.pop(key)
+            if record_type in PROXIABLE_TYPES and record.get('proxied') != proxied:
+                to_update.append((record, content, priority))
+            else:
+                unchanged.append(record)
+        else:
+            stale.append(record)
+
+    missing = list(desired.values())
+    pairs = min(len(stale), len(missing))
+    to_update += [(record, *value) for record, value in zip(stale[:pairs], missing[:pairs])]
+    to_create = missing[pairs:]
+    to_delete = stale[pairs:]
+    return unchanged, to_update, to_create, to_delete
+
+
+def sync_record_set(session: requests.Session, zone_id: str, fqdn: str, record_type: str,
+                    values: Iterable[str], proxied: bool = False, ttl: int = 1,
+                    dry_run: bool = False) -> Dict:
+    """Makes the record set for fqdn/record_type hold exactly `values`.
+
+    Raises requests.exceptions.RequestException if the lookup fails; failures
+    of individual writes are reported in the returned 'errors' list.
+    """
+    existing = list_records(session, zone_id, fqdn, record_type)
+    unchanged, to_update, to_create, to_delete = plan_record_set(existing, record_type, values, proxied)
+
+    result = {
+        'record': fqdn,
+        'type': record_type,
+        'unchanged': [r['content'] for r in unchanged],
+        'updated': [],
+        'created': [],
+        'deleted': [],
+        'errors': [],
+    }
+    if dry_run:
+        result['updated'] = [f"{r['content']} -> {content}" for r, content, _ in to_update]
+        result['created'] = [content for content, _ in to_create]
+        result['deleted'] = [r['content'] for r in to_delete]
+        return result
+
+    base_url = f"{CLOUDFLARE_API}/zones/{zone_id}/dns_records"
+
+    def update(record, content, priority):
+        resp = session.put(f"{base_url}/{record['id']}",
+                           json=_record_payload(fqdn, record_type, content, priority, proxied, ttl))
+        return 'updated', f"{record['content']} -> {content}", resp
+
+    def create(content, priority):
+        resp = session.post(base_url, json=_record_payload(fqdn, record_type, content, priority, proxied, ttl))
+        return 'created', content, resp
+
+    def delete(record):
+        resp = session.delete(f"{base_url}/{record['id']}")
+        return 'deleted', record['content'], resp
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = [pool.submit(update, *args) for args in to_update]
+        futures += [pool.submit(create, *args) for args in to_create]
+        futures += [pool.submit(delete, record) for record in to_delete]
+
+        for future in futures:
+            try:
+                action, content, resp = future.result()
+            except requests.exceptions.RequestException as e:
+                result['errors'].append({'error': str(e)})
+                continue
+            if resp.ok:
+                result[action].append(content)
+            else:
+                result['errors'].append({'action': action, 'content': content, 'details': resp.text})
+
+    return result
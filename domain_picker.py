@@ -0,0 +1,110 @@
+"""
+Fuzzy, incremental domain picker for accounts with thousands of domains.
+
+DomainIndex is built once from the domain list. Each keystroke is matched
+against the previous keystroke's result set when the query only grew, so
+typing narrows an ever smaller candidate list instead of rescanning every
+domain. Only the best page of matches is handed to the prompt for rendering.
+"""
+
+import fnmatch
+import heapq
+import re
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import questionary
+from prompt_toolkit.completion import Completer, Completion
+
+PAGE_SIZE = 50
+
+
+class DomainIndex:
+    """Prebuilt search index over domain names.
+
+    Names are kept shortest-first, and for every character the index holds the
+    positions of the names containing it, so a query only ever scans the names
+    that contain its rarest character.
+    """
+
+    def __init__(self, names: Iterable[str], meta: Optional[Dict[str, str]] = None):
+        self.names: List[str] = sorted(names, key=lambda name: (len(name), name.lower()))
+        self.lowered: List[str] = [name.lower() for name in self.names]
+        self.meta = meta or {}
+        self.postings: Dict[str, List[int]] = {}
+        for i, name in enumerate(self.lowered):
+            for char in set(name):
+                self.postings.setdefault(char, []).append(i)
+        self._last_query = ''
+        self._last_matches: Sequence[int] = range(len(self.names))
+
+    def _candidates(self, query: str) -> Sequence[int]:
+        # Extending the previous query can only remove matches, never add them
+        if self._last_query and query.startswith(self._last_query):
+            return self._last_matches
+        return min((self.postings.get(char, []) for char in set(query)), key=len)
+
+    def match(self, query: str) -> Sequence[int]:
+        """Returns the indexes of every name containing query as a subsequence."""
+        query = query.lower().strip()
+        if not query:
+            self._last_query, self._last_matches = '', range(len(self.names))
+            return self._last_matches
+
+        candidates = self._candidates(query)
+        if len(query) == 1:
+            matches = candidates
+        else:
+            lowered = self.lowered
+            search = re.compile('.*?'.join(map(re.escape, query)), re.DOTALL).search
+            matches = [i for i in candidates if search(lowered[i])]
+
+        self._last_query, self._last_matches = query, matches
+        return matches
+
+    def search(self, query: str, limit: int = PAGE_SIZE) -> List[str]:
+        """Returns the best `limit` names for query, best match first.
+
+        Contiguous matches rank above scattered ones, then earlier matches;
+        ties keep the index order (shorter names first).
+        """
+        matches = self.match(query)
+        query = query.lower().strip()
+        if not query:
+            return self.names[:limit]
+
+        lowered = self.lowered
+
+        def rank(i: int):
+            position = lowered[i].find(query)
+            return position if position >= 0 else len(lowered[i]) + 1
+
+        return [self.names[i] for i in heapq.nsmallest(limit, matches, key=rank)]
+
+    def glob(self, pattern: str) -> List[str]:
+        """Returns every name matching a shell-style glob, in index order."""
+        regex = re.compile(fnmatch.translate(pattern.lower()))
+        return [name for name, lowered in zip(self.names, self.lowered) if regex.match(lowered)]
+
+
+class DomainCompleter(Completer):
+    """prompt_toolkit completer that serves one page of fuzzy matches."""
+
+    def __init__(self, index: DomainIndex, page_size: int = PAGE_SIZE):
+        self.index = index
+        self.page_size = page_size
+
+    def get_completions(self, document, complete_event):
+        text = document.text_before_cursor
+        for name in self.index.search(text, limit=self.page_size):
+            yield Completion(name, start_position=-len(text), display_meta=self.index.meta.get(name, ''))
+
+
+def pick_domain(index: DomainIndex, message: str) -> Optional[str]:
+    """Prompts for a domain with incremental fuzzy completion."""
+    known = set(index.names)
+    return questionary.autocomplete(
+        message,
+        choices=[],
+        completer=DomainCompleter(index),
+        validate=lambda text: text in known or "Pick a domain from the list",
+    ).ask()
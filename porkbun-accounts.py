@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Run list, audit and nameserver operations across several Porkbun accounts.
+
+All configured accounts (see porkbun_accounts.py for the .env format) are
+processed concurrently and their results merged into one stream, each line
+tagged with the account it came from.
+
+`ns <glob> --set NS1 NS2 ...` updates the nameservers of every matching
+domain in every account, after listing the matches and asking to confirm.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+from typing import Dict, List
+
+import questionary
+from dotenv import load_dotenv
+
+from porkbun_accounts import (audit_api_access, fan_out, get_nameservers, list_domains, load_accounts,
+                              set_nameservers)
+from porkbun_records import iter_domain_records
+
+# Load environment variables
+env_path = os.path.join(os.path.dirname(__file__), '.env')
+load_dotenv(env_path)
+
+
+def matching_domains(account, pattern: str):
+    """Yields the account's domains that match a glob."""
+    for record in iter_domain_records(account.get_auth_payload(), session=account.session):
+        if fnmatch.fnmatch(record.domain.lower(), pattern.lower()):
+            yield record.domain
+
+
+def nameservers_operation(pattern: str):
+    """Returns an account operation reporting the nameservers of matching domains."""
+    def operation(account):
+        return (get_nameservers(account, domain) for domain in matching_domains(account, pattern))
+    return operation
+
+
+def update_nameservers_operation(targets: Dict[str, List[str]], nameservers: List[str]):
+    """Returns an account operation setting the nameservers of its domains in targets."""
+    def operation(account):
+        return (set_nameservers(account, domain, nameservers) for domain in targets.get(account.name, []))
+    return operation
+
+
+def collect_targets(accounts, pattern: str) -> Dict[str, List[str]]:
+    """Lists the matching domains of every account (concurrently), by account name."""
+    targets: Dict[str, List[str]] = {}
+    for result in fan_out(accounts, lambda account: ({'domain': d} for d in matching_domains(account, pattern))):
+        if 'error' in result:
+            print(format_result('ns', result))
+            continue
+        targets.setdefault(result['account'], []).append(result['domain'])
+    return targets
+
+
+def format_result(command: str, result: dict) -> str:
+    """Formats one tagged result for display."""
+    prefix = f"[{result['account']}]"
+    if 'error' in result and 'domain' not in result:
+        return f"{prefix} ❌ {result['error']}"
+    if command == 'list':
+        return f"{prefix} {result['domain']} (Status: {result['status']}, Expires: {result['expires'] or 'Unknown'})"
+    if command == 'audit':
+        if result['api_access']:
+            return f"{prefix} ✅ {result['domain']}: API access enabled"
+        return f"{prefix} ❌ {result['domain']}: {result['error']}"
+    if result['success'] and result.get('updated'):
+        return f"{prefix} ✅ {result['domain']}: nameservers set to {', '.join(result['nameservers'])}"
+    if result['success']:
+        return f"{prefix} {result['domain']}: {', '.join(result['nameservers']) or 'default Porkbun nameservers'}"
+    return f"{prefix} ❌ {result['domain']}: {result['error']}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Porkbun operations across all configured accounts.")
+    parser.add_argument('command', choices=['list', 'audit', 'ns'], help="Operation to run on every account")
+    parser.add_argument('pattern', nargs='?', default='*', help="Domain glob for 'ns' (default: all domains)")
+    parser.add_argument('--account', action='append', help="Only use this account (repeatable)")
+    parser.add_argument('--set', nargs='+', metavar='NAMESERVER', dest='set_ns',
+                        help="With 'ns': set these nameservers (2-4) on every matching domain")
+    parser.add_argument('--yes', action='store_true', help="Do not ask for confirmation before updating")
+    parser.add_argument('--jsonl', action='store_true', help="Print one JSON object per line")
+    args = parser.parse_args()
+
+    if args.set_ns:
+        if args.command != 'ns':
+            parser.error("--set can only be used with 'ns'")
+        if not 2 <= len(args.set_ns) <= 4:
+            parser.error("--set takes between 2 and 4 nameservers")
+        invalid = [ns for ns in args.set_ns if '.' not in ns]
+        if invalid:
+            parser.error(f"Invalid nameserver format: {', '.join(invalid)}")
+
+    try:
+        accounts = load_accounts()
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+    if args.account:
+        accounts = [account for account in accounts if account.name in args.account]
+
+    if not accounts:
+        print("Error: No Porkbun accounts configured.")
+        print("Set PORKBUN_ACCOUNTS (with per-account keys) or PORKBUN_API_KEY/PORKBUN_SECRET_KEY in your .env file.")
+        return
+
+    if not args.jsonl:
+        print(f"Running '{args.command}' on {len(accounts)} account(s): {', '.join(a.name for a in accounts)}\n")
+
+    if args.set_ns:
+        targets = collect_targets(accounts, args.pattern)
+        total = sum(len(domains) for domains in targets.values())
+        if not total:
+            print(f"No domains match '{args.pattern}'.")
+            return
+        if not args.jsonl:
+            print(f"'{args.pattern}' matches {total} domain(s):")
+            for name, domains in targets.items():
+                for domain in domains:
+                    print(f"  • [{name}] {domain}")
+            print(f"\nNew nameservers: {', '.join(args.set_ns)}")
+        confirm_update = args.yes or questionary.confirm(
+            f"\nConfirm updating nameservers for {total} domain(s)?",
+            default=False
+        ).ask()
+        if not confirm_update:
+            print("Update cancelled.")
+            return
+        operation = update_nameservers_operation(targets, args.set_ns)
+    else:
+        operation = {
+            'list': list_domains,
+            'audit': audit_api_access,
+            'ns': nameservers_operation(args.pattern),
+        }[args.command]
+
+    count = 0
+    for result in fan_out(accounts, operation):
+        count += 1
+        print(json.dumps(result) if args.jsonl else format_result(args.command, result), flush=True)
+
+    if not args.jsonl:
+        print(f"\n{count} result(s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Run a JSONL file of mixed registrar/DNS operations.
+
+Each input line is one operation:
+
+    {"op": "check_domain", "domain": "example.com"}
+    {"op": "register", "domain": "example.com"}
+    {"op": "get_ns", "domain": "example.com", "account": "clienta"}
+    {"op": "set_ns", "domain": "example.com", "ns": ["ns1.example.net", "ns2.example.net"]}
+    {"op": "upsert_record", "domain": "example.com", "name": "www", "type": "A",
+     "values": ["203.0.113.10", "203.0.113.11"], "proxied": true}
+
+Operations run on a bounded worker pool. Operations on the same domain run
+one after another in file order; different domains run in parallel. One JSONL
+result per operation (with its input line number and timing) is streamed in
+completion order. Only a bounded window of operations is held in memory, so
+input files of any length run in constant memory.
+
+Porkbun operations use the accounts from porkbun_accounts (the optional
+"account" field picks one, default: the first). upsert_record uses the
+Cloudflare settings from .env; "zone_id" may override CLOUDFLARE_ZONE_ID.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, TextIO
+
+from dotenv import load_dotenv
+
+from cloudflare_dns import make_session, sync_record_set
+from porkbun_accounts import Account, load_accounts
+
+# Load environment variables
+env_path = os.path.join(os.path.dirname(__file__), '.env')
+load_dotenv(env_path)
+
+CLOUDFLARE_API_TOKEN = os.getenv('CLOUDFLARE_API_TOKEN')
+CLOUDFLARE_ZONE_ID = os.getenv('CLOUDFLARE_ZONE_ID')
+
+DEFAULT_WORKERS = 16
+# Operations read ahead of completion, per worker
+WINDOW_PER_WORKER = 4
+
+
+class BatchError(Exception):
+    """An operation that cannot run (bad input or configuration)."""
+
+
+def string_list(op: Dict, field: str) -> List[str]:
+    """Returns op[field] as a list of non-empty strings; a single string becomes a list."""
+    value = op.get(field)
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list) or not all(isinstance(item, str) and item.strip() for item in value):
+        raise BatchError(f'"{field}" must be a string or a list of non-empty strings')
+    return [item.strip() for item in value]
+
+
+def op_check_domain(ctx: 'BatchContext', op: Dict) -> Dict:
+    """Checks whether a domain is available and what it costs."""
+    data = ctx.account(op).post(f"domain/checkDomain/{op['domain']}")
+    response = data.get('response', {})
+    return {'available': response.get('avail') == 'yes', 'price': response.get('price')}
+
+
+def op_register(ctx: 'BatchContext', op: Dict) -> Dict:
+    """Registers a domain name."""
+    if not ctx.allow_register:
+        raise BatchError('register operations are disabled; rerun with --allow-register')
+    # Porkbun uses the default contact info from the account
+    data = ctx.account(op).post('domain/create', domain=op['domain'], registrantContact={})
+    return {'response': data}
+
+
+def op_get_ns(ctx: 'BatchContext', op: Dict) -> Dict:
+    """Gets the current nameservers for a domain."""
+    data = ctx.account(op).post(f"domain/getNs/{op['domain']}")
+    return {'nameservers': data.get('ns', [])}
+
+
+def op_set_ns(ctx: 'BatchContext', op: Dict) -> Dict:
+    """Updates the nameservers for a domain."""
+    nameservers = string_list(op, 'ns')
+    if not 2 <= len(nameservers) <= 4:
+        raise BatchError('set_ns needs between 2 and 4 nameservers in "ns"')
+    ctx.account(op).post(f"domain/updateNs/{op['domain']}", ns=nameservers)
+    return {'nameservers': nameservers}
+
+
+def op_upsert_record(ctx: 'BatchContext', op: Dict) -> Dict:
+    """Makes a Cloudflare record set hold exactly the given values."""
+    zone_id = op.get('zone_id') or CLOUDFLARE_ZONE_ID
+    if not (ctx.cloudflare and zone_id):
+        raise BatchError('upsert_record needs CLOUDFLARE_API_TOKEN and a zone id')
+    name = op.get('name', '@')
+    fqdn = op['domain'] if name == '@' else f"{name}.{op['domain']}"
+    if op.get('values') is None and op.get('content') is None:
+        raise BatchError('upsert_record needs "values"')
+    values = string_list(op, 'values' if op.get('values') is not None else 'content')
+    if not values:
+        raise BatchError('upsert_record needs "values"')
+    result = sync_record_set(ctx.cloudflare, zone_id, fqdn, op.get('type', 'A'), values,
+                             proxied=op.get('proxied', False), ttl=op.get('ttl', 1))
+    if result['errors']:
+        raise BatchError(json.dumps(result['errors']))
+    return result
+
+
+OPERATIONS: Dict[str, Callable[['BatchContext', Dict], Dict]] = {
+    'check_domain': op_check_domain,
+    'register': op_register,
+    'get_ns': op_get_ns,
+    'set_ns': op_set_ns,
+    'upsert_record': op_upsert_record,
+}
+
+
+class BatchContext:
+    """Shared clients for the operations of one batch run."""
+
+    def __init__(self, accounts, allow_register: bool = False):
+        self.accounts: Dict[str, Account] = {account.name: account for account in accounts}
+        self.default_account: Optional[Account] = accounts[0] if accounts else None
+        self.cloudflare = make_session(CLOUDFLARE_API_TOKEN) if CLOUDFLARE_API_TOKEN else None
+        self.allow_register = allow_register
+
+    def account(self, op: Dict) -> Account:
+        """Returns the account named by the operation, or the default one."""
+        name = op.get('account')
+        account = self.accounts.get(name) if name else self.default_account
+        if account is None:
+            raise BatchError(f"Unknown Porkbun account '{name}'" if name else 'No Porkbun account configured')
+        return account
+
+
+class BatchRunner:
+    """Executes operations with per-domain ordering on a bounded pool.
+
+    Each domain has at most one operation running; later operations for it
+    wait in that domain's queue. A semaphore caps how many operations are
+    read but not yet finished, which bounds memory regardless of input size.
+    """
+
+    def __init__(self, ctx: BatchContext, output: TextIO, workers: int = DEFAULT_WORKERS):
+        self.ctx = ctx
+        self.output = output
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        self.window_size = workers * WINDOW_PER_WORKER
+        self.window = threading.BoundedSemaphore(self.window_size)
+        self.lock = threading.Lock()
+        # domain -> operations waiting behind the one currently running
+        self.queues: Dict[str, deque] = {}
+        self.counts = {'ok': 0, 'failed': 0}
+
+    def emit(self, result: Dict) -> None:
+        """Writes one result line."""
+        with self.lock:
+            self.counts['ok' if result['ok'] else 'failed'] += 1
+            self.output.write(json.dumps(result) + '\n')
+
+    def execute(self, line_no: int, op: Dict) -> None:
+        """Runs one operation on a worker thread and reports its result."""
+        started = time.perf_counter()
+        result = {'line': line_no, 'op': op.get('op'), 'domain': op.get('domain')}
+        try:
+            result.update(ok=True, result=OPERATIONS[op['op']](self.ctx, op))
+        except Exception as e:
+            result.update(ok=False, error=str(e))
+        result['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        try:
+            self.emit(result)
+        finally:
+            self.finish(op['domain'])
+
+    def finish(self, domain: str) -> None:
+        """Starts the next queued operation for domain, if any."""
+        with self.lock:
+            waiting = self.queues[domain]
+            following = waiting.popleft() if waiting else None
+            if following is None:
+                del self.queues[domain]
+        if following is not None:
+            self.pool.submit(self.execute, *following)
+        self.window.release()
+
+    def submit(self, line_no: int, op: Dict) -> None:
+        """Starts op now, or queues it behind the running operation for its domain."""
+        domain = op['domain']
+        with self.lock:
+            if domain in self.queues:
+                self.queues[domain].append((line_no, op))
+                return
+            self.queues[domain] = deque()
+        self.pool.submit(self.execute, line_no, op)
+
+    def run(self, lines) -> Dict[str, int]:
+        """Streams operations from lines and waits for all of them to finish."""
+        for line_no, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            self.window.acquire()
+            try:
+                op = json.loads(line)
+                if not isinstance(op, dict):
+                    raise ValueError('each line must be a JSON object')
+                if not isinstance(op.get('op'), str) or op['op'] not in OPERATIONS:
+                    raise ValueError(f"unknown op {op.get('op')!r}")
+                if not isinstance(op.get('domain'), str) or not op['domain'].strip():
+                    raise ValueError('"domain" must be a non-empty string')
+                op['domain'] = op['domain'].strip().lower()
+            except ValueError as e:
+                self.emit({'line': line_no, 'ok': False, 'error': f'Invalid operation: {e}', 'elapsed_ms': 0.0})
+                self.window.release()
+                continue
+            self.submit(line_no, op)
+
+        # Every slot back in the window means every operation has finished
+        for _ in range(self.window_size):
+            self.window.acquire()
+        self.pool.shutdown()
+        return self.counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a JSONL batch of registrar/DNS operations.")
+    parser.add_argument('input', help="JSONL file with one operation per line ('-' for stdin)")
+    parser.add_argument('--output', help="Write JSONL results here instead of stdout")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help="Operations run concurrently")
+    parser.add_argument('--allow-register', action='store_true', help="Allow 'register' operations (they spend money)")
+    args = parser.parse_args()
+
+    try:
+        accounts = load_accounts()
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return
+
+    ctx = BatchContext(accounts, allow_register=args.allow_register)
+    started = time.perf_counter()
+
+    source = sys.stdin if args.input == '-' else open(args.input)
+    output = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        counts = BatchRunner(ctx, output, workers=args.workers).run(source)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+
+    print(f"Done in {time.perf_counter() - started:.1f}s: {counts['ok']} succeeded, {counts['failed']} failed",
+          file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Export the Porkbun domain inventory to CSV and/or Parquet.
+
+Domains are streamed page by page from listAll straight into the export
+files, so large accounts never need to be loaded all at once.
+"""
+
+import argparse
+import csv
+import os
+
+from dotenv import load_dotenv
+
+from porkbun_records import FIELDS, PorkbunAPIError, iter_domain_records, write_csv, write_parquet
+
+# Load environment variables
+env_path = os.path.join(os.path.dirname(__file__), '.env')
+load_dotenv(env_path)
+
+PORKBUN_API_KEY = os.getenv('PORKBUN_API_KEY')
+PORKBUN_SECRET_KEY = os.getenv('PORKBUN_SECRET_KEY')
+
+
+def get_auth_payload():
+    """Returns the authentication payload for API requests."""
+    return {
+        'apikey': PORKBUN_API_KEY,
+        'secretapikey': PORKBUN_SECRET_KEY
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the Porkbun domain inventory.")
+    parser.add_argument('--csv', help="Write the inventory to this CSV file")
+    parser.add_argument('--parquet', help="Write the inventory to this Parquet file (requires pyarrow)")
+    args = parser.parse_args()
+
+    print("Porkbun Domain Inventory")
+    print("========================")
+
+    if not all([PORKBUN_API_KEY, PORKBUN_SECRET_KEY]):
+        print("\nError: Missing Porkbun API credentials.")
+        print("Please add PORKBUN_API_KEY and PORKBUN_SECRET_KEY to your .env file.")
+        return
+
+    if not (args.csv or args.parquet):
+        parser.error("choose at least one of --csv or --parquet")
+
+    records = iter_domain_records(get_auth_payload())
+
+    try:
+        if args.csv and args.parquet:
+            # Single pass over the API: each record is written to the CSV on
+            # its way into the Parquet writer
+            with open(args.csv, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(FIELDS)
+
+                def passthrough():
+                    for record in records:
+                        writer.writerow(record.to_row())
+                        yield record
+
+                count = write_parquet(passthrough(), args.parquet)
+        elif args.csv:
+            count = write_csv(records, args.csv)
+        else:
+            count = write_parquet(records, args.parquet)
+    except PorkbunAPIError as e:
+        print(f"\n❌ Error: {e}")
+        if e.details:
+            print(f"Details: {e.details}")
+        return
+    except RuntimeError as e:
+        print(f"\n❌ Error: {e}")
+        return
+
+    print(f"\n✅ Exported {count} domain(s)")
+    for path in (args.csv, args.parquet):
+        if path:
+            print(f"   • {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 #https://porkbun.com/api/json/v3/documentation
 # Porkbun Nameserver Management Tool
 
+import argparse
 import os
 import requests
 import json
@@ -8,6 +9,9 @@ import questionary
 from dotenv import load_dotenv
 from typing import List, Dict, Optional
 
+from domain_picker import DomainIndex, pick_domain
+from porkbun_records import DomainRecord, PorkbunAPIError, iter_domain_records
+
 # Load environment variables
 env_path = os.path.join(os.path.dirname(__file__), '.env')
 load_dotenv(env_path)
@@ -28,49 +32,25 @@ def get_domain_details(domain: str) -> Dict:
     if not all([PORKBUN_API_KEY, PORKBUN_SECRET_KEY]):
         return {'success': False, 'error': 'Missing Porkbun API credentials in .env file.'}
 
-    # Try the domain details endpoint which might include nameserver info
-    url = f"{PORKBUN_API_URL}/domain/listAll"
-    payload = get_auth_payload()
-
     try:
-        response = requests.post(url, json=payload)
-        response.raise_for_status()
-        data = response.json()
-
-        if data.get('status') == 'SUCCESS':
-            domains = data.get('domains', [])
-            # Find the specific domain
-            for dom in domains:
-                if dom.get('domain') == domain:
-                    return {'success': True, 'domain_info': dom}
-            return {'success': False, 'error': f'Domain {domain} not found in account'}
-        else:
-            return {'success': False, 'error': 'Failed to retrieve domain details.', 'details': data}
-
-    except requests.exceptions.RequestException as e:
-        return {'success': False, 'error': str(e), 'details': e.response.json() if e.response else 'No response'}
+        # Stream listAll page by page and stop at the first match
+        for record in iter_domain_records(get_auth_payload(), api_url=PORKBUN_API_URL):
+            if record.domain == domain:
+                return {'success': True, 'domain_info': record}
+        return {'success': False, 'error': f'Domain {domain} not found in account'}
+    except PorkbunAPIError as e:
+        return {'success': False, 'error': str(e), 'details': e.details}
 
 def list_domains() -> Dict:
-    """Retrieves all domains in the account."""
+    """Retrieves all domains in the account as DomainRecord objects."""
     if not all([PORKBUN_API_KEY, PORKBUN_SECRET_KEY]):
         return {'success': False, 'error': 'Missing Porkbun API credentials in .env file.'}
 
-    url = f"{PORKBUN_API_URL}/domain/listAll"
-    payload = get_auth_payload()
-
     try:
-        response = requests.post(url, json=payload)
-        response.raise_for_status()
-        data = response.json()
-
-        if data.get('status') == 'SUCCESS':
-            domains = data.get('domains', [])
-            return {'success': True, 'domains': domains}
-        else:
-            return {'success': False, 'error': 'Failed to retrieve domains.', 'details': data}
-
-    except requests.exceptions.RequestException as e:
-        return {'success': False, 'error': str(e), 'details': e.response.json() if e.response else 'No response'}
+        domains = list(iter_domain_records(get_auth_payload(), api_url=PORKBUN_API_URL))
+        return {'success': True, 'domains': domains}
+    except PorkbunAPIError as e:
+        return {'success': False, 'error': str(e), 'details': e.details}
 
 def get_nameservers(domain: str) -> Dict:
     """Gets the current nameservers for a domain."""
@@ -131,13 +111,11 @@ def update_nameservers(domain: str, nameservers: List[str]) -> Dict:
     except requests.exceptions.RequestException as e:
         return {'success': False, 'error': str(e), 'details': e.response.json() if e.response else 'No response'}
 
-def format_domain_info(domain: Dict) -> str:
+def format_domain_info(domain: DomainRecord) -> str:
     """Formats domain information for display."""
-    domain_name = domain.get('domain', 'Unknown')
-    status = domain.get('status', 'Unknown')
-    expiry = domain.get('expiry', 'Unknown')
-    
-    return f"{domain_name} (Status: {status}, Expires: {expiry})"
+    expiry = domain.expire_date or 'Unknown'
+
+    return f"{domain.domain} (Status: {domain.status}, Expires: {expiry})"
 
 def get_nameserver_input() -> List[str]:
     """Gets nameserver input from user with validation."""
@@ -170,53 +148,8 @@ def get_nameserver_input() -> List[str]:
     
     return nameservers
 
-def main():
-    """Main function to run the nameserver management tool."""
-    print("Porkbun Nameserver Management Tool")
-    print("==================================")
-
-    if not all([PORKBUN_API_KEY, PORKBUN_SECRET_KEY]):
-        print("\nError: Missing Porkbun API credentials.")
-        print("Please add PORKBUN_API_KEY and PORKBUN_SECRET_KEY to your .env file.")
-        return
-
-    # Get all domains
-    print("\nRetrieving your domains...")
-    domains_result = list_domains()
-    
-    if not domains_result.get('success'):
-        print(f"\nError: {domains_result.get('error')}")
-        if domains_result.get('details'):
-            print(f"Details: {json.dumps(domains_result.get('details'), indent=2)}")
-        return
-
-    domains = domains_result.get('domains', [])
-    
-    if not domains:
-        print("No domains found in your account.")
-        return
-
-    print(f"\nFound {len(domains)} domain(s) in your account:")
-    
-    # Create choices for domain selection
-    domain_choices = []
-    for domain in domains:
-        formatted_info = format_domain_info(domain)
-        domain_choices.append({
-            'name': formatted_info,
-            'value': domain.get('domain')
-        })
-
-    # Let user select a domain
-    selected_domain = questionary.select(
-        "Select a domain to manage nameservers:",
-        choices=domain_choices
-    ).ask()
-
-    if not selected_domain:
-        print("No domain selected. Exiting.")
-        return
-
+def manage_domain(selected_domain: str, new_nameservers: Optional[List[str]] = None, assume_yes: bool = False):
+    """Shows and optionally updates the nameservers of a single domain."""
     print(f"\nSelected domain: {selected_domain}")
 
     # Get current nameservers - try multiple approaches
@@ -260,20 +193,21 @@ def main():
     else:
         print("  No nameservers found or using default Porkbun nameservers.")
 
-    # Ask if user wants to change nameservers
-    change_ns = questionary.confirm(
-        f"\nDo you want to change the nameservers for {selected_domain}?",
-        default=False
-    ).ask()
+    if not new_nameservers:
+        # Ask if user wants to change nameservers
+        change_ns = questionary.confirm(
+            f"\nDo you want to change the nameservers for {selected_domain}?",
+            default=False
+        ).ask()
+
+        if not change_ns:
+            print("No changes made.")
+            return
 
-    if not change_ns:
-        print("No changes made. Exiting.")
-        return
+        # Get new nameservers
+        print(f"\nEntering new nameservers for {selected_domain}:")
+        new_nameservers = get_nameserver_input()
 
-    # Get new nameservers
-    print(f"\nEntering new nameservers for {selected_domain}:")
-    new_nameservers = get_nameserver_input()
-    
     if not new_nameservers:
         print("No nameservers entered. Exiting.")
         return
@@ -283,7 +217,7 @@ def main():
         print(f"  {i}. {ns}")
 
     # Confirm the change
-    confirm_update = questionary.confirm(
+    confirm_update = assume_yes or questionary.confirm(
         f"\nConfirm updating nameservers for {selected_domain}?",
         default=False
     ).ask()
@@ -304,5 +238,69 @@ def main():
         if update_result.get('details'):
             print(f"Details: {json.dumps(update_result.get('details'), indent=2)}")
 
+def main():
+    """Main function to run the nameserver management tool."""
+    parser = argparse.ArgumentParser(description="Manage Porkbun nameservers.")
+    parser.add_argument('domain', nargs='?', help="Domain or glob (e.g. '*.dev') to manage without the picker")
+    parser.add_argument('--ns', nargs='+', metavar='NAMESERVER', help="New nameservers to set (2-4)")
+    parser.add_argument('--yes', action='store_true', help="Do not ask for confirmation before updating")
+    args = parser.parse_args()
+
+    if args.ns and not 2 <= len(args.ns) <= 4:
+        parser.error("--ns takes between 2 and 4 nameservers")
+
+    print("Porkbun Nameserver Management Tool")
+    print("==================================")
+
+    if not all([PORKBUN_API_KEY, PORKBUN_SECRET_KEY]):
+        print("\nError: Missing Porkbun API credentials.")
+        print("Please add PORKBUN_API_KEY and PORKBUN_SECRET_KEY to your .env file.")
+        return
+
+    # Get all domains
+    print("\nRetrieving your domains...")
+    domains_result = list_domains()
+    
+    if not domains_result.get('success'):
+        print(f"\nError: {domains_result.get('error')}")
+        if domains_result.get('details'):
+            print(f"Details: {json.dumps(domains_result.get('details'), indent=2)}")
+        return
+
+    domains = domains_result.get('domains', [])
+    
+    if not domains:
+        print("No domains found in your account.")
+        return
+
+    print(f"\nFound {len(domains)} domain(s) in your account.")
+
+    index = DomainIndex(
+        (domain.domain for domain in domains),
+        meta={domain.domain: f"{domain.status}, expires {domain.expire_date or 'Unknown'}" for domain in domains}
+    )
+
+    if args.domain:
+        # Skip the picker when the domain (or a glob) is given on the command line
+        selected_domains = index.glob(args.domain)
+        if not selected_domains:
+            print(f"No domains match '{args.domain}'.")
+            return
+    else:
+        selected_domain = pick_domain(index, "Select a domain to manage nameservers (type to search):")
+        if not selected_domain:
+            print("No domain selected. Exiting.")
+            return
+        selected_domains = [selected_domain]
+
+    if len(selected_domains) > 1:
+        records = {domain.domain: domain for domain in domains}
+        print(f"\n'{args.domain}' matches {len(selected_domains)} domain(s):")
+        for name in selected_domains:
+            print(f"  • {format_domain_info(records[name])}")
+
+    for selected_domain in selected_domains:
+        manage_domain(selected_domain, args.ns, args.yes)
+
 if __name__ == '__main__':
     main()
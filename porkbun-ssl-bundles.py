@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Bulk-fetch the free Porkbun SSL certificate bundles.
+
+Bundles are retrieved concurrently, hashed, and only written (atomically) when
+the certificate actually changed since the last run. An index of every
+domain's certificate hash and expiry is kept next to the bundles so expiring
+certificates can be listed without calling the API.
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+import requests
+from dotenv import load_dotenv
+
+from porkbun_records import PorkbunAPIError, iter_domain_records
+
+# Load environment variables
+env_path = os.path.join(os.path.dirname(__file__), '.env')
+load_dotenv(env_path)
+
+PORKBUN_API_KEY = os.getenv('PORKBUN_API_KEY')
+PORKBUN_SECRET_KEY = os.getenv('PORKBUN_SECRET_KEY')
+PORKBUN_API_URL = 'https://api.porkbun.com/api/json/v3'
+
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ssl-bundles')
+INDEX_FILE = 'index.json'
+# File name -> (bundle field, mode); the private key is readable by the owner only
+BUNDLE_FILES = {
+    'domain.cert.pem': ('certificatechain', 0o644),
+    'private.key.pem': ('privatekey', 0o600),
+    'public.key.pem': ('publickey', 0o644),
+}
+
+
+def get_auth_payload() -> Dict[str, str]:
+    """Returns the authentication payload for API requests."""
+    return {
+        'apikey': PORKBUN_API_KEY,
+        'secretapikey': PORKBUN_SECRET_KEY
+    }
+
+
+def retrieve_ssl_bundle(session: requests.Session, domain: str) -> Dict:
+    """Retrieves the SSL bundle (certificate chain and keys) for a domain."""
+    url = f"{PORKBUN_API_URL}/ssl/retrieve/{domain}"
+
+    try:
+        response = session.post(url, json=get_auth_payload())
+        try:
+            data = response.json()
+        except ValueError:
+            data = {'message': response.text}
+
+        if response.status_code == 200 and data.get('status') == 'SUCCESS':
+            return {'success': True, 'bundle': data}
+        return {'success': False, 'error': data.get('message', f'Failed to retrieve SSL bundle for {domain}.')}
+    except requests.exceptions.RequestException as e:
+        return {'success': False, 'error': str(e)}
+
+
+def _der_element(data: bytes, pos: int):
+    """Reads one DER TLV at pos; returns (tag, content_start, content_end)."""
+    tag = data[pos]
+    length = data[pos + 1]
+    pos += 2
+    if length & 0x80:
+        size = length & 0x7f
+        length = int.from_bytes(data[pos:pos + size], 'big')
+        pos += size
+    return tag, pos, pos + length
+
+
+def certificate_expiry(pem: str) -> Optional[datetime]:
+    """Returns the notAfter date of the first (leaf) certificate in a PEM chain."""
+    begin = pem.find('-----BEGIN CERTIFICATE-----')
+    end = pem.find('-----END CERTIFICATE-----', begin)
+    if begin < 0 or end < 0:
+        return None
+    try:
+        der = base64.b64decode(''.join(pem[begin:end].splitlines()[1:]))
+        # Certificate -> tbsCertificate -> [version], serial, signature, issuer, validity
+        _, pos, _ = _der_element(der, 0)
+        _, pos, _ = _der_element(der, pos)
+        tag, start, end = _der_element(der, pos)
+        if tag == 0xa0:
+            tag, start, end = _der_element(der, end)
+        for _ in range(3):
+            tag, start, end = _der_element(der, end)
+        _, _, not_before_end = _der_element(der, start)
+        tag, start, end = _der_element(der, not_before_end)
+        value = der[start:end].decode('ascii')
+    except (IndexError, ValueError):
+        return None
+
+    # UTCTime (0x17) has a two-digit year, GeneralizedTime (0x18) four
+    fmt = '%y%m%d%H%M%SZ' if tag == 0x17 else '%Y%m%d%H%M%SZ'
+    try:
+        return datetime.strptime(value, fmt).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def bundle_hash(bundle: Dict) -> str:
+    """Hashes the parts of a bundle that end up on disk."""
+    digest = hashlib.sha256()
+    for field, _ in BUNDLE_FILES.values():
+        digest.update(bundle.get(field, '').encode())
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def write_atomic(path: str, content: str, mode: int = 0o644) -> None:
+    """Writes a file through a temporary file and rename so it is never partially written."""
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_index(output_dir: str) -> Dict:
+    """Loads the per-domain hash/expiry index, empty if there is none yet."""
+    try:
+        with open(os.path.join(output_dir, INDEX_FILE)) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_index(output_dir: str, index: Dict) -> None:
+    """Atomically rewrites the per-domain hash/expiry index."""
+    write_atomic(os.path.join(output_dir, INDEX_FILE), json.dumps(index, indent=2, sort_keys=True) + '\n')
+
+
+def sync_bundle(session: requests.Session, domain: str, output_dir: str, known_hash: Optional[str]) -> Dict:
+    """Fetches one domain's bundle and writes it only if it changed."""
+    result = retrieve_ssl_bundle(session, domain)
+    if not result['success']:
+        return {'domain': domain, 'status': 'error', 'error': result['error']}
+
+    bundle = result['bundle']
+    digest = bundle_hash(bundle)
+    domain_dir = os.path.join(output_dir, domain)
+    files_present = all(os.path.exists(os.path.join(domain_dir, name)) for name in BUNDLE_FILES)
+    expiry = certificate_expiry(bundle.get('certificatechain', ''))
+    entry = {
+        'domain': domain,
+        'sha256': digest,
+        'not_after': expiry.isoformat() if expiry else None,
+    }
+
+    if digest == known_hash and files_present:
+        return dict(entry, status='unchanged')
+
+    os.makedirs(domain_dir, exist_ok=True)
+    for name, (field, mode) in BUNDLE_FILES.items():
+        write_atomic(os.path.join(domain_dir, name), bundle.get(field, ''), mode)
+    return dict(entry, status='updated')
+
+
+def fetch_bundles(domains: List[str], output_dir: str = OUTPUT_DIR, workers: int = 8) -> List[Dict]:
+    """Fetches bundles for many domains concurrently and updates the index."""
+    os.makedirs(output_dir, exist_ok=True)
+    index = load_index(output_dir)
+    now = datetime.now(timezone.utc).isoformat(timespec='seconds')
+    results = []
+
+    try:
+        with requests.Session() as session, ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(sync_bundle, session, domain, output_dir, index.get(domain, {}).get('sha256')): domain
+                for domain in domains
+            }
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # A bad chain or a failed write only loses this domain
+                    result = {'domain': futures[future], 'status': 'error', 'error': f"{type(e).__name__}: {e}"}
+                results.append(result)
+                if result['status'] == 'error':
+                    print(f"  ✗ {result['domain']}: {result['error']}")
+                    continue
+
+                entry = index.setdefault(result['domain'], {})
+                entry.update(sha256=result['sha256'], not_after=result['not_after'], checked_at=now)
+                if result['status'] == 'updated':
+                    entry['changed_at'] = now
+                print(f"  {'✓' if result['status'] == 'updated' else '='} {result['domain']} "
+                      f"({result['status']}, expires {result['not_after'] or 'unknown'})")
+    finally:
+        # Keep the index in step with the bundles already rewritten this run
+        save_index(output_dir, index)
+    return results
+
+
+def expiring_certificates(days: int, output_dir: str = OUTPUT_DIR) -> List[Dict]:
+    """Lists indexed certificates that expire within `days` days, soonest first."""
+    cutoff = datetime.now(timezone.utc) + timedelta(days=days)
+    expiring = []
+    for domain, entry in load_index(output_dir).items():
+        if entry.get('not_after') and datetime.fromisoformat(entry['not_after']) <= cutoff:
+            expiring.append({'domain': domain, 'not_after': entry['not_after']})
+    return sorted(expiring, key=lambda entry: entry['not_after'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-fetch Porkbun SSL bundles.")
+    parser.add_argument('domains', nargs='*', help="Domains to fetch (default: every active domain in the account)")
+    parser.add_argument('--output', default=OUTPUT_DIR, help="Directory for the bundles and index")
+    parser.add_argument('--workers', type=int, default=8, help="Concurrent API requests")
+    parser.add_argument('--expiring', type=int, metavar='DAYS',
+                        help="Only list indexed certificates expiring within DAYS days (no API calls)")
+    args = parser.parse_args()
+
+    print("Porkbun SSL Bundle Fetcher")
+    print("==========================")
+
+    if args.expiring is not None:
+        expiring = expiring_certificates(args.expiring, args.output)
+        print(f"\nCertificates expiring within {args.expiring} day(s): {len(expiring)}")
+        for entry in expiring:
+            print(f"   • {entry['domain']} ({entry['not_after']})")
+        return
+
+    if not all([PORKBUN_API_KEY, PORKBUN_SECRET_KEY]):
+        print("\nError: Missing Porkbun API credentials.")
+        print("Please add PORKBUN_API_KEY and PORKBUN_SECRET_KEY to your .env file.")
+        return
+
+    domains = args.domains
+    if not domains:
+        try:
+            domains = [record.domain for record in iter_domain_records(get_auth_payload(), api_url=PORKBUN_API_URL)
+                       if record.status == 'ACTIVE']
+        except PorkbunAPIError as e:
+            print(f"\n❌ Failed to retrieve domains: {e}")
+            return
+
+    print(f"\nFetching SSL bundles for {len(domains)} domain(s)...")
+    results = fetch_bundles(domains, args.output, args.workers)
+
+    counts = {status: sum(r['status'] == status for r in results) for status in ('updated', 'unchanged', 'error')}
+    print(f"\nUpdated: {counts['updated']}, unchanged: {counts['unchanged']}, failed: {counts['error']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+"""
+Multiple Porkbun accounts, processed concurrently.
+
+Accounts are configured in .env:
+
+    PORKBUN_ACCOUNTS=clienta,clientb
+    PORKBUN_API_KEY_CLIENTA=pk1_...
+    PORKBUN_SECRET_KEY_CLIENTA=sk1_...
+    PORKBUN_RATE_LIMIT_CLIENTA=5      # optional, requests per second
+
+Without PORKBUN_ACCOUNTS the single PORKBUN_API_KEY/PORKBUN_SECRET_KEY pair
+is used as an account named 'default'. Every account gets its own rate
+limiter and connection pool; fan_out() runs an operation on all accounts at
+once and merges their results into one stream tagged with the account name.
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from porkbun_records import PORKBUN_API_URL, PorkbunAPIError, iter_domain_records
+
+DEFAULT_RATE_LIMIT = 10.0
+POOL_SIZE = 8
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` calls per second."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class RateLimitedSession(requests.Session):
+    """Session that waits for its rate limiter before every request."""
+
+    def __init__(self, limiter: RateLimiter, pool_size: int = POOL_SIZE):
+        super().__init__()
+        self.limiter = limiter
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def request(self, *args, **kwargs):
+        self.limiter.acquire()
+        return super().request(*args, **kwargs)
+
+
+@dataclass(slots=True)
+class Account:
+    """One set of Porkbun API credentials with its own session."""
+    name: str
+    api_key: str = field(repr=False)
+    secret_key: str = field(repr=False)
+    rate_limit: float = DEFAULT_RATE_LIMIT
+    session: requests.Session = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.session = RateLimitedSession(RateLimiter(self.rate_limit))
+
+    def get_auth_payload(self) -> Dict[str, str]:
+        """Returns the authentication payload for API requests."""
+        return {
+            'apikey': self.api_key,
+            'secretapikey': self.secret_key
+        }
+
+    def post(self, endpoint: str, **fields) -> Dict:
+        """POSTs to an API endpoint and returns the JSON body.
+
+        Raises PorkbunAPIError unless Porkbun answers with status SUCCESS.
+        """
+        try:
+            response = self.session.post(f"{PORKBUN_API_URL}/{endpoint}", json=dict(self.get_auth_payload(), **fields))
+        except requests.exceptions.RequestException as e:
+            raise PorkbunAPIError(str(e), 'No response') from e
+        try:
+            data = response.json()
+        except ValueError:
+            data = {'message': response.text}
+        if response.status_code != 200 or data.get('status') != 'SUCCESS':
+            raise PorkbunAPIError(data.get('message') or f'{endpoint} failed with HTTP {response.status_code}', data)
+        return data
+
+
+def _rate_limit(env, key: str) -> float:
+    """Reads a requests-per-second limit, which must be a positive number."""
+    value = env.get(key, DEFAULT_RATE_LIMIT)
+    try:
+        rate_limit = float(value)
+    except ValueError:
+        raise ValueError(f"{key} must be a number, got '{value}'") from None
+    if not 0 < rate_limit < float('inf'):
+        raise ValueError(f"{key} must be a positive number, got '{value}'")
+    return rate_limit
+
+
+def load_accounts(env=os.environ) -> List[Account]:
+    """Builds the accounts configured in the environment."""
+    names = [name.strip() for name in env.get('PORKBUN_ACCOUNTS', '').split(',') if name.strip()]
+    if not names:
+        if env.get('PORKBUN_API_KEY') and env.get('PORKBUN_SECRET_KEY'):
+            return [Account('default', env['PORKBUN_API_KEY'], env['PORKBUN_SECRET_KEY'],
+                            _rate_limit(env, 'PORKBUN_RATE_LIMIT'))]
+        return []
+
+    accounts = []
+    for name in names:
+        suffix = name.upper().replace('-', '_')
+        api_key = env.get(f'PORKBUN_API_KEY_{suffix}')
+        secret_key = env.get(f'PORKBUN_SECRET_KEY_{suffix}')
+        if not (api_key and secret_key):
+            raise ValueError(f"Missing PORKBUN_API_KEY_{suffix} or PORKBUN_SECRET_KEY_{suffix} for account '{name}'")
+        rate_limit = _rate_limit(env, f'PORKBUN_RATE_LIMIT_{suffix}')
+        accounts.append(Account(name, api_key, secret_key, rate_limit))
+    return accounts
+
+
+def list_domains(account: Account) -> Iterator[Dict]:
+    """Yields every domain of the account."""
+    for record in iter_domain_records(account.get_auth_payload(), session=account.session):
+        yield {'domain': record.domain, 'status': record.status, 'expires': record.expire_date}
+
+
+def get_nameservers(account: Account, domain: str) -> Dict:
+    """Returns the nameservers of one domain, or the error that prevented it."""
+    try:
+        return {'domain': domain, 'success': True, 'nameservers': account.post(f'domain/getNs/{domain}').get('ns', [])}
+    except PorkbunAPIError as e:
+        return {'domain': domain, 'success': False, 'error': str(e)}
+
+
+def set_nameservers(account: Account, domain: str, nameservers: List[str]) -> Dict:
+    """Updates the nameservers of one domain, reporting the error that prevented it."""
+    try:
+        account.post(f'domain/updateNs/{domain}', ns=nameservers)
+        return {'domain': domain, 'success': True, 'updated': True, 'nameservers': nameservers}
+    except PorkbunAPIError as e:
+        return {'domain': domain, 'success': False, 'error': str(e)}
+
+
+def audit_api_access(account: Account, domains: Optional[Iterable[str]] = None) -> Iterator[Dict]:
+    """Checks API access (via getNs) for the account's domains, POOL_SIZE at a time."""
+    if domains is None:
+        domains = (record.domain for record in iter_domain_records(account.get_auth_payload(), session=account.session))
+    with ThreadPoolExecutor(max_workers=POOL_SIZE) as pool:
+        for result in pool.map(lambda domain: get_nameservers(account, domain), domains):
+            yield {
+                'domain': result['domain'],
+                'api_access': result['success'],
+                **({'nameservers': result['nameservers']} if result['success'] else {'error': result['error']})
+            }
+
+
+def fan_out(accounts: List[Account], operation: Callable[[Account], Iterable[Dict]]) -> Iterator[Dict]:
+    """Runs operation on every account concurrently and yields the merged results.
+
+    Each result is tagged with its 'account'. Results arrive as soon as any
+    account produces them; a failing account yields one result with 'error'.
+    """
+    results: queue.Queue = queue.Queue(maxsize=1000)
+    done = object()
+
+    def worker(account: Account):
+        try:
+            for item in operation(account):
+                results.put({'account': account.name, **item})
+        except Exception as e:
+            # Any failure ends this account only; the other accounts keep going
+            results.put({'account': account.name, 'error': str(e)})
+        finally:
+            results.put(done)
+
+    threads = [threading.Thread(target=worker, args=(account,), daemon=True) for account in accounts]
+    for thread in threads:
+        thread.start()
+
+    remaining = len(threads)
+    while remaining:
+        item = results.get()
+        if item is done:
+            remaining -= 1
+        else:
+            yield item
@@ -0,0 +1,176 @@
+"""
+Compact domain records for the Porkbun listAll endpoint.
+
+The listAll JSON is parsed straight into slotted DomainRecord objects (the
+intermediate dicts are dropped as soon as each record is built) and pages of
+1000 domains are streamed, so accounts with tens of thousands of domains never
+sit in memory as raw dicts. Records can be exported to CSV or Parquet in a
+streaming fashion.
+"""
+
+import csv
+import json
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import requests
+
+PORKBUN_API_URL = 'https://api.porkbun.com/api/json/v3'
+# listAll returns at most this many domains per call
+PAGE_SIZE = 1000
+
+
+class PorkbunAPIError(Exception):
+    """Raised when a Porkbun API call fails; details holds the response body."""
+
+    def __init__(self, message: str, details=None):
+        super().__init__(message)
+        self.details = details
+
+
+@dataclass(slots=True)
+class DomainRecord:
+    """A single domain from listAll."""
+    domain: str
+    status: str
+    tld: str
+    create_date: str
+    expire_date: str
+    security_lock: bool
+    whois_privacy: bool
+    auto_renew: bool
+    not_local: bool
+    labels: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_api(cls, data: Dict) -> 'DomainRecord':
+        """Builds a record from one entry of the listAll 'domains' array."""
+        return cls(
+            domain=data.get('domain', ''),
+            status=data.get('status') or 'Unknown',
+            tld=data.get('tld', ''),
+            create_date=data.get('createDate') or '',
+            expire_date=data.get('expireDate') or '',
+            security_lock=_as_bool(data.get('securityLock')),
+            whois_privacy=_as_bool(data.get('whoisPrivacy')),
+            auto_renew=_as_bool(data.get('autoRenew')),
+            not_local=_as_bool(data.get('notLocal')),
+            labels=tuple(label.get('title', '') for label in data.get('labels') or ()),
+        )
+
+    def to_row(self) -> Tuple:
+        """Returns the record as a tuple in FIELDS order."""
+        return (self.domain, self.status, self.tld, self.create_date, self.expire_date,
+                self.security_lock, self.whois_privacy, self.auto_renew, self.not_local,
+                ';'.join(self.labels))
+
+
+FIELDS = ('domain', 'status', 'tld', 'create_date', 'expire_date', 'security_lock',
+          'whois_privacy', 'auto_renew', 'not_local', 'labels')
+
+
+def _as_bool(value) -> bool:
+    """Porkbun mixes "1"/"0" strings and 1/0 integers for flags."""
+    return str(value) == '1'
+
+
+def _object_hook(obj: Dict):
+    # Label objects are nested inside domains, so they are converted first and
+    # reach DomainRecord.from_api as plain dicts
+    if 'domain' in obj and 'tld' in obj:
+        return DomainRecord.from_api(obj)
+    return obj
+
+
+def parse_domains(text: str) -> List[DomainRecord]:
+    """Parses a raw listAll response body into DomainRecord objects."""
+    try:
+        data = json.loads(text, object_hook=_object_hook)
+    except ValueError as e:
+        raise PorkbunAPIError('Invalid listAll response', text) from e
+    if not isinstance(data, dict) or data.get('status') != 'SUCCESS':
+        raise PorkbunAPIError('Failed to retrieve domains.', data)
+    return data.get('domains', [])
+
+
+def iter_domain_records(auth_payload: Dict[str, str],
+                        session: Optional[requests.Session] = None,
+                        api_url: str = PORKBUN_API_URL) -> Iterator[DomainRecord]:
+    """Yields every domain in the account, fetching listAll one page at a time."""
+    http = session or requests
+    url = f"{api_url}/domain/listAll"
+    start = 0
+
+    while True:
+        payload = dict(auth_payload, start=start, includeLabels='yes')
+        try:
+            response = http.post(url, json=payload)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            details = 'No response'
+            if e.response is not None:
+                details = e.response.text
+            raise PorkbunAPIError(str(e), details) from e
+
+        page = parse_domains(response.text)
+        yield from page
+
+        if len(page) < PAGE_SIZE:
+            return
+        start += PAGE_SIZE
+
+
+def write_csv(records: Iterable[DomainRecord], path: str) -> int:
+    """Streams records to a CSV file and returns how many were written."""
+    count = 0
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDS)
+        for record in records:
+            writer.writerow(record.to_row())
+            count += 1
+    return count
+
+
+def write_parquet(records: Iterable[DomainRecord], path: str, batch_size: int = 10000) -> int:
+    """Streams records to a Parquet file in row groups of batch_size.
+
+    Requires pyarrow. Only one batch of columns is held in memory at a time.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise RuntimeError('Parquet export requires pyarrow (uv add pyarrow).') from e
+
+    schema = pa.schema([
+        ('domain', pa.string()),
+        ('status', pa.string()),
+        ('tld', pa.string()),
+        ('create_date', pa.string()),
+        ('expire_date', pa.string()),
+        ('security_lock', pa.bool_()),
+        ('whois_privacy', pa.bool_()),
+        ('auto_renew', pa.bool_()),
+        ('not_local', pa.bool_()),
+        ('labels', pa.list_(pa.string())),
+    ])
+
+    count = 0
+    columns = {name: [] for name in FIELDS}
+    with pq.ParquetWriter(path, schema) as writer:
+        def flush():
+            writer.write_batch(pa.record_batch([columns[name] for name in FIELDS], schema=schema))
+            for values in columns.values():
+                values.clear()
+
+        for record in records:
+            for name in FIELDS:
+                value = getattr(record, name)
+                columns[name].append(list(value) if name == 'labels' else value)
+            count += 1
+            if len(columns['domain']) >= batch_size:
+                flush()
+        if columns['domain']:
+            flush()
+    return count
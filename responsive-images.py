@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Build responsive size/format variants for the landing page images.
+
+Every image in public/images (plus HERO_IMAGE_PATH) is resized to a set of
+widths and re-encoded as AVIF/WebP across a process pool. Animated GIFs become
+animated WebP (and an MP4 when ffmpeg is available). A content-hash cache keeps
+unchanged images from being reprocessed, and a manifest is written for the
+Astro components to emit srcset.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+
+try:
+    from PIL import Image, ImageSequence, features
+except ImportError:  # Pillow is only needed for this build step
+    Image = None
+
+# Load environment variables
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+env_path = os.path.join(ROOT_DIR, '.env')
+load_dotenv(env_path)
+
+PUBLIC_DIR = os.path.join(ROOT_DIR, 'public')
+SOURCE_DIR = os.path.join(PUBLIC_DIR, 'images')
+OUTPUT_DIR = os.path.join(SOURCE_DIR, 'responsive')
+MANIFEST_PATH = os.path.join(ROOT_DIR, 'src', 'utils', 'image-manifest.json')
+CACHE_PATH = os.path.join(ROOT_DIR, '.image-cache.json')
+HERO_IMAGE_PATH = os.getenv('HERO_IMAGE_PATH', '/images/image1.webp')
+
+SOURCE_EXTENSIONS = ('.webp', '.png', '.jpg', '.jpeg', '.gif')
+WIDTHS = [480, 768, 1024, 1600]
+QUALITY = {'avif': 55, 'webp': 80}
+# Bump when the encoding settings change so cached entries are rebuilt
+PIPELINE_VERSION = 1
+
+
+def get_output_formats() -> List[str]:
+    """Returns the output formats supported by the installed Pillow build."""
+    formats = []
+    if features.check('avif'):
+        formats.append('avif')
+    if features.check('webp'):
+        formats.append('webp')
+    return formats
+
+
+def public_url(path: str) -> str:
+    """Maps a file under public/ to the URL it is served from."""
+    return '/' + os.path.relpath(path, PUBLIC_DIR).replace(os.sep, '/')
+
+
+def find_sources() -> List[str]:
+    """Returns every source image, including the configured hero image."""
+    sources = []
+    for name in sorted(os.listdir(SOURCE_DIR)):
+        path = os.path.join(SOURCE_DIR, name)
+        if os.path.isfile(path) and name.lower().endswith(SOURCE_EXTENSIONS):
+            sources.append(path)
+
+    hero_path = os.path.join(PUBLIC_DIR, HERO_IMAGE_PATH.lstrip('/'))
+    if os.path.isfile(hero_path) and hero_path not in sources:
+        sources.append(hero_path)
+    return sources
+
+
+def hash_file(path: str, formats: List[str]) -> str:
+    """Hashes the image content together with the settings used to encode it."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([PIPELINE_VERSION, WIDTHS, QUALITY, formats]).encode())
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def target_widths(source_width: int) -> List[int]:
+    """Returns the variant widths for a source, never upscaling."""
+    widths = [w for w in WIDTHS if w < source_width]
+    widths.append(min(source_width, WIDTHS[-1]))
+    return widths
+
+
+def resize_frames(image, width: int) -> List:
+    """Resizes every frame of a (possibly animated) image to the given width."""
+    height = round(image.height * width / image.width)
+    return [frame.convert('RGBA').resize((width, height), Image.LANCZOS)
+            for frame in ImageSequence.Iterator(image)]
+
+
+def convert_to_video(source: str, destination: str) -> bool:
+    """Converts an animated GIF to a muted, looping-friendly MP4 via ffmpeg."""
+    ffmpeg = shutil.which('ffmpeg')
+    if not ffmpeg:
+        return False
+    command = [
+        ffmpeg, '-y', '-loglevel', 'error', '-i', source,
+        '-movflags', 'faststart', '-pix_fmt', 'yuv420p',
+        '-vf', 'scale=trunc(iw/2)*2:trunc(ih/2)*2', destination
+    ]
+    return subprocess.run(command).returncode == 0
+
+
+def process_image(source: str, digest: str, formats: List[str]) -> Dict:
+    """Writes all variants for one source image and returns its manifest entry."""
+    stem = os.path.splitext(os.path.basename(source))[0]
+    # Short content hash in the file name keeps CDN caches honest
+    prefix = f"{stem}-{digest[:8]}"
+
+    with Image.open(source) as image:
+        animated = getattr(image, 'is_animated', False)
+        entry = {
+            'width': image.width,
+            'height': image.height,
+            'animated': animated,
+            'variants': {fmt: [] for fmt in formats},
+        }
+
+        for width in target_widths(image.width):
+            frames = resize_frames(image, width)
+            for fmt in formats:
+                # Pillow's AVIF encoder does not handle animation reliably
+                if animated and fmt != 'webp':
+                    continue
+                out_path = os.path.join(OUTPUT_DIR, f"{prefix}-{width}.{fmt}")
+                save_args = {'quality': QUALITY[fmt]}
+                if animated:
+                    save_args.update(
+                        save_all=True,
+                        append_images=frames[1:],
+                        duration=image.info.get('duration', 100),
+                        loop=image.info.get('loop', 0),
+                    )
+                frames[0].save(out_path, fmt.upper(), **save_args)
+                entry['variants'][fmt].append({'src': public_url(out_path), 'width': width})
+
+    entry['variants'] = {fmt: v for fmt, v in entry['variants'].items() if v}
+
+    if animated and source.lower().endswith('.gif'):
+        video_path = os.path.join(OUTPUT_DIR, f"{prefix}.mp4")
+        if convert_to_video(source, video_path):
+            entry['video'] = public_url(video_path)
+
+    return entry
+
+
+def entry_files(entry: Dict) -> List[str]:
+    """Lists the public URLs written for a manifest entry."""
+    urls = [v['src'] for variants in entry['variants'].values() for v in variants]
+    if entry.get('video'):
+        urls.append(entry['video'])
+    return urls
+
+
+def load_json(path: str) -> Dict:
+    """Loads a JSON file, returning an empty dict if it is missing or invalid."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def write_json(path: str, data: Dict) -> None:
+    """Writes JSON through a temporary file so readers never see a partial file."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+def remove_stale_variants(manifest: Dict) -> int:
+    """Deletes generated files that no manifest entry points at anymore."""
+    keep = {os.path.basename(url) for entry in manifest.values() for url in entry_files(entry)}
+    removed = 0
+    for name in os.listdir(OUTPUT_DIR):
+        if name not in keep:
+            os.remove(os.path.join(OUTPUT_DIR, name))
+            removed += 1
+    return removed
+
+
+def build(workers: Optional[int] = None, force: bool = False) -> Dict:
+    """Builds variants for every changed image and rewrites the manifest."""
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    formats = get_output_formats()
+    cache = {} if force else load_json(CACHE_PATH)
+    manifest = {}
+    pending = {}
+
+    for source in find_sources():
+        url = public_url(source)
+        digest = hash_file(source, formats)
+        cached = cache.get(url)
+        if (cached and cached.get('hash') == digest and all(
+                os.path.exists(os.path.join(PUBLIC_DIR, f.lstrip('/'))) for f in entry_files(cached['entry']))):
+            manifest[url] = cached['entry']
+            print(f"  = {url} (unchanged)")
+        else:
+            pending[url] = (source, digest)
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(process_image, source, digest, formats): url
+                for url, (source, digest) in pending.items()
+            }
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    manifest[url] = future.result()
+                except Exception as e:
+                    print(f"  ✗ {url}: {e}")
+                    continue
+                cache[url] = {'hash': pending[url][1], 'entry': manifest[url]}
+                print(f"  ✓ {url} ({len(entry_files(manifest[url]))} files)")
+
+    cache = {url: cache[url] for url in manifest if url in cache}
+    write_json(CACHE_PATH, cache)
+    write_json(MANIFEST_PATH, manifest)
+    removed = remove_stale_variants(manifest)
+
+    return {'processed': len(pending), 'cached': len(manifest) - len(pending), 'removed': removed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build responsive image variants for the landing page.")
+    parser.add_argument('--workers', type=int, default=None, help="Number of worker processes (default: CPU count)")
+    parser.add_argument('--force', action='store_true', help="Ignore the cache and rebuild every image")
+    args = parser.parse_args()
+
+    print("Responsive Image Builder")
+    print("========================")
+
+    if Image is None:
+        print("\nError: Pillow is not installed.")
+        print("Install it with: uv add pillow")
+        return
+
+    formats = get_output_formats()
+    print(f"Output formats: {', '.join(formats)}\n")
+
+    summary = build(workers=args.workers, force=args.force)
+
+    print(f"\nProcessed: {summary['processed']}, unchanged: {summary['cached']}, "
+          f"stale files removed: {summary['removed']}")
+    print(f"Manifest written to {os.path.relpath(MANIFEST_PATH, ROOT_DIR)}")
+    print(f"Commit {os.path.relpath(MANIFEST_PATH, ROOT_DIR)} together with "
+          f"{os.path.relpath(OUTPUT_DIR, ROOT_DIR)}/ so the srcsets never point at missing files.")
+
+
+if __name__ == '__main__':
+    main()